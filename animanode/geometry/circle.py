@@ -3,11 +3,17 @@ Parametric circle geometry for AnimaNode
 Based on three/geometry/CircleGeometry.py mathematical approach
 """
 
-import struct
+import numpy as np
 
 from .parametric import GeometryParameters, ParametricGeometry
 
 
+# Uniform layout mirroring the WGSL GeometryParams struct (16 bytes, little-endian)
+_UNIFORM_DTYPE = np.dtype(
+    [("radius", "<f4"), ("segments", "<u4"), ("padding1", "<u4"), ("padding2", "<u4")]
+)
+
+
 class Circle(ParametricGeometry):
     """
     Parametric circle using mathematical function P(t) = (r*cos(t), r*sin(t))
@@ -124,15 +130,12 @@ fn fs_main(in: VertexOutput) -> @location(0) vec4<f32> {
 }
 """
 
-    def _pack_uniform_data(self) -> bytes:
+    def _pack_uniform_data(self) -> np.ndarray:
         """
         Pack circle parameters into 16-byte aligned uniform buffer
         Layout: [radius: f32, segments: u32, padding: u32, padding: u32]
         """
-        return struct.pack(
-            "=fIII",  # Little-endian: float, uint32, uint32, uint32
-            self.parameters["radius"],
-            self.parameters["segments"],
-            0,  # padding for 16-byte alignment
-            0,  # padding for 16-byte alignment
+        return np.array(
+            [(self.parameters["radius"], self.parameters["segments"], 0, 0)],
+            dtype=_UNIFORM_DTYPE,
         )
@@ -6,6 +6,8 @@ Inspired by three directory's mathematical approach with radical simplicity for
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+
 
 class ParametricGeometry(ABC):
     """
@@ -28,7 +30,12 @@ class ParametricGeometry(ABC):
         self._transforms = {"translate": [0.0, 0.0], "rotate": 0.0, "scale": [1.0, 1.0]}
         self.vertex_count = self._calculate_vertex_count()
         self.shader_source = self._generate_shader()
-        self._uniform_data = self._pack_uniform_data()
+        # Structured record matching the WGSL uniform struct
+        self._uniform_array = self._pack_uniform_data()
+        # Bumped whenever the uniform data changes - lets renderers skip uploads
+        self._version = 0
+        # Version at which the record last matched self.parameters
+        self._packed_version = 0
 
     @abstractmethod
     def _calculate_vertex_count(self) -> int:
@@ -51,23 +58,52 @@ class ParametricGeometry(ABC):
         pass
 
     @abstractmethod
-    def _pack_uniform_data(self) -> bytes:
+    def _pack_uniform_data(self) -> np.ndarray:
         """
         Pack parameters into uniform buffer data
 
         Returns:
-            Binary data for GPU uniform buffer (16-byte aligned)
+            One-element structured array laid out like the WGSL uniform struct
+            (16-byte aligned)
         """
         pass
 
-    def get_uniform_data(self) -> bytes:
+    @property
+    def uniform_view(self) -> np.ndarray:
+        """
+        Typed view of the uniform parameters, one field per WGSL struct member
+
+        Fields may be written in place; get_uniform_data() reflects the change
+        without repacking. Call mark_uniforms_dirty() after writing so renderers
+        upload the data again. In-place writes do not update self.parameters.
+        """
+        return self._uniform_array
+
+    @property
+    def uniform_version(self) -> int:
+        """
+        Counter that changes whenever the uniform data changes
+
+        Returns:
+            Version to compare against the one last uploaded
+        """
+        return self._version
+
+    def mark_uniforms_dirty(self) -> None:
+        """
+        Signal that fields of uniform_view were written in place
+        """
+        self._version += 1
+
+    def get_uniform_data(self) -> np.ndarray:
         """
         Get packed uniform buffer data
 
         Returns:
-            Binary uniform data ready for GPU upload
+            Contiguous uint8 view of the uniform parameters ready for GPU upload
         """
-        return self._uniform_data
+        # Viewed on demand - a stored view would detach from the record on pickle or copy
+        return self._uniform_array.view(np.uint8)
 
     def get_uniform_size(self) -> int:
         """
@@ -76,7 +112,7 @@ class ParametricGeometry(ABC):
         Returns:
             Size in bytes (always 16-byte aligned)
         """
-        return len(self._uniform_data)
+        return self._uniform_array.nbytes
 
     def update_parameter(self, name: str, value: Any) -> None:
         """
@@ -88,11 +124,22 @@ class ParametricGeometry(ABC):
         """
         if name not in self.parameters:
             raise ValueError(f"Parameter '{name}' not found in geometry")
+        # Nothing to regenerate unless the value changed or fields were edited in place
+        if self.parameters[name] == value and self._packed_version == self._version:
+            return
 
         self.parameters[name] = value
         self.vertex_count = self._calculate_vertex_count()
         self.shader_source = self._generate_shader()
-        self._uniform_data = self._pack_uniform_data()
+
+        # Compare against the record itself, not self.parameters - uniform_view
+        # fields may have been written in place since the last repack
+        uniform_array = self._pack_uniform_data()
+        if uniform_array.tobytes() != self._uniform_array.tobytes():
+            # Copy into the existing record so views handed out earlier stay valid
+            self._uniform_array[...] = uniform_array
+            self._version += 1
+        self._packed_version = self._version
 
     # Transform methods - architecture prepared for future implementation
     def translate(self, x: float, y: float):
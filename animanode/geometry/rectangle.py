@@ -3,11 +3,17 @@ Parametric rectangle geometry for AnimaNode
 Based on three/geometry/QuadGeometry.py mathematical approach
 """
 
-import struct
+import numpy as np
 
 from .parametric import GeometryParameters, ParametricGeometry
 
 
+# Uniform layout mirroring the WGSL GeometryParams struct (16 bytes, little-endian)
+_UNIFORM_DTYPE = np.dtype(
+    [("width", "<f4"), ("height", "<f4"), ("padding1", "<f4"), ("padding2", "<f4")]
+)
+
+
 class Rectangle(ParametricGeometry):
     """
     Parametric rectangle using mathematical corner calculation
@@ -43,7 +49,7 @@ class Rectangle(ParametricGeometry):
         Generate WGSL shader with parametric rectangle mathematics
 
         Mathematical approach:
-        - Corner calculation: (±width/2, ±height/2)
+        - Corner calculation: (±width/2, ±height/2) from a module-scope const table
         - Two triangles forming a quad
         - Vertex color interpolation across corners
         """
@@ -58,6 +64,26 @@ struct GeometryParams {
 @group(0) @binding(0)
 var<uniform> params: GeometryParams;
 
+// Unit quad corners (±0.5) as two triangles - following three directory's quad construction
+const CORNERS = array<vec2<f32>, 6>(
+    vec2<f32>(-0.5, -0.5),  // Triangle 1: bottom-left
+    vec2<f32>(0.5, -0.5),   // Triangle 1: bottom-right
+    vec2<f32>(0.5, 0.5),    // Triangle 1: top-right
+    vec2<f32>(-0.5, -0.5),  // Triangle 2: bottom-left
+    vec2<f32>(0.5, 0.5),    // Triangle 2: top-right
+    vec2<f32>(-0.5, 0.5),   // Triangle 2: top-left
+);
+
+// Color mapping for vertices - following three's vertex color pattern
+const COLORS = array<vec3<f32>, 6>(
+    vec3<f32>(1.0, 0.0, 0.0),  // Red - bottom-left
+    vec3<f32>(0.0, 1.0, 0.0),  // Green - bottom-right
+    vec3<f32>(0.0, 0.0, 1.0),  // Blue - top-right
+    vec3<f32>(1.0, 0.0, 0.0),  // Red - bottom-left (triangle 2)
+    vec3<f32>(0.0, 0.0, 1.0),  // Blue - top-right (triangle 2)
+    vec3<f32>(1.0, 1.0, 0.0),  // Yellow - top-left
+);
+
 struct VertexInput {
     @builtin(vertex_index) vertex_index : u32,
 };
@@ -69,34 +95,14 @@ struct VertexOutput {
 
 @vertex
 fn vs_main(in: VertexInput) -> VertexOutput {
+    let index = i32(in.vertex_index);
+
     // Mathematical corner calculation: (±width/2, ±height/2)
-    let half_w = params.width * 0.5;
-    let half_h = params.height * 0.5;
-
-    // Two triangles forming a quad - following three directory's quad construction
-    var positions = array<vec2<f32>, 6>(
-        vec2<f32>(-half_w, -half_h),  // Triangle 1: bottom-left
-        vec2<f32>(half_w, -half_h),   // Triangle 1: bottom-right
-        vec2<f32>(half_w, half_h),    // Triangle 1: top-right
-        vec2<f32>(-half_w, -half_h),  // Triangle 2: bottom-left
-        vec2<f32>(half_w, half_h),    // Triangle 2: top-right
-        vec2<f32>(-half_w, half_h),   // Triangle 2: top-left
-    );
-
-    // Color mapping for vertices - following three's vertex color pattern
-    var colors = array<vec3<f32>, 6>(
-        vec3<f32>(1.0, 0.0, 0.0),  // Red - bottom-left
-        vec3<f32>(0.0, 1.0, 0.0),  // Green - bottom-right
-        vec3<f32>(0.0, 0.0, 1.0),  // Blue - top-right
-        vec3<f32>(1.0, 0.0, 0.0),  // Red - bottom-left (triangle 2)
-        vec3<f32>(0.0, 0.0, 1.0),  // Blue - top-right (triangle 2)
-        vec3<f32>(1.0, 1.0, 0.0),  // Yellow - top-left
-    );
+    let position = CORNERS[index] * vec2<f32>(params.width, params.height);
 
-    let index = i32(in.vertex_index);
     var out: VertexOutput;
-    out.pos = vec4<f32>(positions[index], 0.0, 1.0);
-    out.color = vec4<f32>(colors[index], 1.0);
+    out.pos = vec4<f32>(position, 0.0, 1.0);
+    out.color = vec4<f32>(COLORS[index], 1.0);
     return out;
 }
 
@@ -108,15 +114,12 @@ fn fs_main(in: VertexOutput) -> @location(0) vec4<f32> {
 }
 """
 
-    def _pack_uniform_data(self) -> bytes:
+    def _pack_uniform_data(self) -> np.ndarray:
         """
         Pack rectangle parameters into 16-byte aligned uniform buffer
         Layout: [width: f32, height: f32, padding: f32, padding: f32]
         """
-        return struct.pack(
-            "=ffff",  # Little-endian: 4 floats for 16-byte alignment
-            self.parameters["width"],
-            self.parameters["height"],
-            0.0,  # padding for 16-byte alignment
-            0.0,  # padding for 16-byte alignment
+        return np.array(
+            [(self.parameters["width"], self.parameters["height"], 0.0, 0.0)],
+            dtype=_UNIFORM_DTYPE,
         )
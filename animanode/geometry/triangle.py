@@ -3,11 +3,19 @@ Parametric triangle geometry for AnimaNode
 Enhanced version of the original hardcoded triangle with mathematical parameterization
 """
 
-import struct
+import math
+
+import numpy as np
 
 from .parametric import GeometryParameters, ParametricGeometry
 
 
+# Uniform layout mirroring the WGSL GeometryParams struct (16 bytes, little-endian)
+_UNIFORM_DTYPE = np.dtype(
+    [("size", "<f4"), ("rotation", "<f4"), ("cos_rotation", "<f4"), ("sin_rotation", "<f4")]
+)
+
+
 class Triangle(ParametricGeometry):
     """
     Parametric triangle with configurable size and orientation
@@ -18,6 +26,9 @@ class Triangle(ParametricGeometry):
     - Consistent with three directory's parametric approach
     """
 
+    # Rotation the cached cos/sin were computed for
+    _trig_rotation = None
+
     def __init__(self, size: float = 1.0, rotation: float = 0.0):
         """
         Create parametric triangle
@@ -44,7 +55,7 @@ class Triangle(ParametricGeometry):
         Generate WGSL shader with parametric triangle mathematics
 
         Mathematical approach:
-        - Base triangle vertices with mathematical scaling
+        - Base triangle vertices from a module-scope const table (no vertex buffer)
         - Rotation transformation using rotation matrix
         - Size scaling parameter
         """
@@ -52,13 +63,27 @@ class Triangle(ParametricGeometry):
 struct GeometryParams {
     size: f32,
     rotation: f32,
-    padding1: f32,  // 16-byte alignment
-    padding2: f32,
+    cos_rotation: f32,  // Precomputed on the CPU, fills the 16-byte alignment
+    sin_rotation: f32,
 };
 
 @group(0) @binding(0)
 var<uniform> params: GeometryParams;
 
+// Base triangle vertices - constant table baked into the shader
+const BASE_POSITIONS = array<vec2<f32>, 3>(
+    vec2<f32>(0.0, -0.5),   // Bottom vertex
+    vec2<f32>(0.5, 0.5),    // Top-right vertex
+    vec2<f32>(-0.5, 0.75),  // Top-left vertex (slightly higher for visual interest)
+);
+
+// Color mapping - sRGB colors for each vertex
+const COLORS = array<vec3<f32>, 3>(
+    vec3<f32>(1.0, 1.0, 0.0),  // Yellow - bottom
+    vec3<f32>(1.0, 0.0, 1.0),  // Magenta - top-right
+    vec3<f32>(0.0, 1.0, 1.0),  // Cyan - top-left
+);
+
 struct VertexInput {
     @builtin(vertex_index) vertex_index : u32,
 };
@@ -70,29 +95,15 @@ struct VertexOutput {
 
 @vertex
 fn vs_main(in: VertexInput) -> VertexOutput {
-    // Base triangle vertices - mathematical positioning
-    var base_positions = array<vec2<f32>, 3>(
-        vec2<f32>(0.0, -0.5),   // Bottom vertex
-        vec2<f32>(0.5, 0.5),    // Top-right vertex
-        vec2<f32>(-0.5, 0.75),  // Top-left vertex (slightly higher for visual interest)
-    );
-
-    // Color mapping - sRGB colors for each vertex
-    var colors = array<vec3<f32>, 3>(
-        vec3<f32>(1.0, 1.0, 0.0),  // Yellow - bottom
-        vec3<f32>(1.0, 0.0, 1.0),  // Magenta - top-right
-        vec3<f32>(0.0, 1.0, 1.0),  // Cyan - top-left
-    );
-
     let index = i32(in.vertex_index);
-    var base_pos = base_positions[index];
+    var base_pos = BASE_POSITIONS[index];
 
     // Apply size scaling - mathematical transformation
     base_pos = base_pos * params.size;
 
     // Apply rotation transformation - 2D rotation matrix
-    let cos_r = cos(params.rotation);
-    let sin_r = sin(params.rotation);
+    let cos_r = params.cos_rotation;
+    let sin_r = params.sin_rotation;
     let rotated_pos = vec2<f32>(
         base_pos.x * cos_r - base_pos.y * sin_r,
         base_pos.x * sin_r + base_pos.y * cos_r
@@ -102,7 +113,7 @@ fn vs_main(in: VertexInput) -> VertexOutput {
     // Aspect ratio correction for 2D rendering
     let xy_ratio = 0.75;  // 480/640 for typical canvas size
     out.pos = vec4<f32>(rotated_pos.x * xy_ratio, rotated_pos.y, 0.0, 1.0);
-    out.color = vec4<f32>(colors[index], 1.0);
+    out.color = vec4<f32>(COLORS[index], 1.0);
     return out;
 }
 
@@ -114,15 +125,33 @@ fn fs_main(in: VertexOutput) -> @location(0) vec4<f32> {
 }
 """
 
-    def _pack_uniform_data(self) -> bytes:
+    def mark_uniforms_dirty(self) -> None:
+        """
+        Signal that fields of uniform_view were written in place
+
+        The shader only reads the trig fields, so cos/sin are derived from the
+        record's rotation here - an in-place rotation write would otherwise be ignored
+        """
+        record = self._uniform_array[0]
+        rotation = float(record["rotation"])
+        record["cos_rotation"] = math.cos(rotation)
+        record["sin_rotation"] = math.sin(rotation)
+        super().mark_uniforms_dirty()
+
+    def _pack_uniform_data(self) -> np.ndarray:
         """
         Pack triangle parameters into 16-byte aligned uniform buffer
-        Layout: [size: f32, rotation: f32, padding: f32, padding: f32]
+        Layout: [size: f32, rotation: f32, cos(rotation): f32, sin(rotation): f32]
         """
-        return struct.pack(
-            "=ffff",  # Little-endian: 4 floats for 16-byte alignment
-            self.parameters["size"],
-            self.parameters["rotation"],
-            0.0,  # padding for 16-byte alignment
-            0.0,  # padding for 16-byte alignment
+        rotation = self.parameters["rotation"]
+        # cos/sin are computed once per rotation instead of per vertex, and only
+        # recomputed when the rotation itself changes
+        if rotation != self._trig_rotation:
+            self._trig_rotation = rotation
+            self._cos_rotation = math.cos(rotation)
+            self._sin_rotation = math.sin(rotation)
+
+        return np.array(
+            [(self.parameters["size"], rotation, self._cos_rotation, self._sin_rotation)],
+            dtype=_UNIFORM_DTYPE,
         )
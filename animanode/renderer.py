@@ -3,9 +3,45 @@ WebGPU renderer for parametric geometries
 Enhanced to support three directory's philosophy with uniform buffers
 """
 
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
 import wgpu
 
-from .geometry.parametric import ParametricGeometry
+
+if TYPE_CHECKING:
+    from .geometry.parametric import ParametricGeometry
+
+
+# Attributes the renderer uses - any object providing them can be drawn
+_GEOMETRY_INTERFACE = ("shader_source", "vertex_count", "get_uniform_data", "get_uniform_size")
+
+# Additionally required by create_dynamic_renderer() to update and track uniforms
+_DYNAMIC_GEOMETRY_INTERFACE = (*_GEOMETRY_INTERFACE, "update_parameter", "uniform_version")
+
+# Devices keyed by (power_preference, limits) - created once and reused by every setup
+_DEVICE_CACHE: dict[tuple, wgpu.GPUDevice] = {}
+_DEVICE_LOCK = asyncio.Lock()
+
+# Compiled GPU objects keyed by device and everything that shapes them, so identical
+# geometries - in one scene or across Scene.draw() calls - never recompile shaders
+_SHADER_CACHE: dict[tuple, wgpu.GPUShaderModule] = {}
+_BIND_GROUP_LAYOUT_CACHE: dict[tuple, wgpu.GPUBindGroupLayout] = {}
+_PIPELINE_CACHE: dict[tuple, wgpu.GPUPromise] = {}
+
+# Flag combinations resolved once instead of OR-ing the enums on every setup
+_UNIFORM_USAGE = int(wgpu.BufferUsage.UNIFORM | wgpu.BufferUsage.COPY_DST)
+_UNIFORM_VISIBILITY = int(wgpu.ShaderStage.VERTEX | wgpu.ShaderStage.FRAGMENT)
+
+# Color attachment settings shared by every frame - only the texture view varies
+_COLOR_ATTACHMENT_TEMPLATE = {
+    "resolve_target": None,
+    "clear_value": (0, 0, 0, 1),
+    "load_op": wgpu.LoadOp.clear,
+    "store_op": wgpu.StoreOp.store,
+}
 
 
 class Renderer:
@@ -37,103 +73,244 @@ class Renderer:
         Returns:
             Draw function ready for canvas.request_draw()
         """
-        if not isinstance(geometry, ParametricGeometry):
-            raise TypeError("geometry must be a ParametricGeometry instance")
+        # A single geometry is a one-item scene
+        return Renderer.setup_scene_drawing_sync(canvas, [geometry], power_preference, limits)
 
-        # Initialize WebGPU adapter and device
-        adapter = wgpu.gpu.request_adapter_sync(power_preference=power_preference)
-        device = adapter.request_device_sync(required_limits=limits)
+    @staticmethod
+    async def setup_drawing_async(canvas, geometry: ParametricGeometry, limits=None):
+        """
+        Setup asynchronous drawing for a parametric geometry
 
-        # Create and populate uniform buffer for geometry parameters
-        uniform_data = geometry.get_uniform_data()
-        uniform_buffer = device.create_buffer(
-            size=geometry.get_uniform_size(),
-            usage=wgpu.BufferUsage.UNIFORM | wgpu.BufferUsage.COPY_DST,
-        )
-        device.queue.write_buffer(uniform_buffer, 0, uniform_data)
+        Args:
+            canvas: Canvas implementing WgpuCanvasInterface
+            geometry: ParametricGeometry instance with parameters
+            limits: GPU limits
 
-        # Create bind group layout for uniforms - following three's Material pattern
-        bind_group_layout = device.create_bind_group_layout(
-            entries=[
-                {
-                    "binding": 0,
-                    "visibility": wgpu.ShaderStage.VERTEX | wgpu.ShaderStage.FRAGMENT,
-                    "buffer": {
-                        "type": wgpu.BufferBindingType.uniform,
-                        "has_dynamic_offset": False,
-                        "min_binding_size": geometry.get_uniform_size(),
-                    },
-                }
-            ]
-        )
+        Returns:
+            Draw function ready for canvas.request_draw() - only the setup is
+            asynchronous, canvases invoke draw functions synchronously
+        """
+        Renderer._check_geometry(geometry)
 
-        # Create bind group with uniform buffer
-        bind_group = device.create_bind_group(
-            layout=bind_group_layout,
-            entries=[
-                {
-                    "binding": 0,
-                    "resource": {
-                        "buffer": uniform_buffer,
-                        "offset": 0,
-                        "size": geometry.get_uniform_size(),
-                    },
-                }
-            ],
-        )
+        # Initialize WebGPU adapter and device asynchronously
+        device = await Renderer._get_device_async("high-performance", limits)
 
-        # Setup render pipeline - enhanced from original
-        pipeline_kwargs = Renderer._get_render_pipeline_kwargs(
+        # Upload geometry parameters and bind them
+        bind_group_layout, bind_group = Renderer._create_uniform_bind_group(device, geometry)
+
+        # Setup render pipeline asynchronously
+        render_pipeline = await Renderer._create_render_pipeline(
             canvas, device, geometry, bind_group_layout
         )
-        render_pipeline = device.create_render_pipeline(**pipeline_kwargs)
 
         return Renderer._get_draw_function(
-            canvas, device, render_pipeline, geometry, bind_group, asynchronous=False
+            canvas, device, [(render_pipeline, bind_group, geometry, ())]
         )
 
     @staticmethod
-    async def setup_drawing_async(canvas, geometry: ParametricGeometry, limits=None):
+    def setup_drawing_static(
+        canvas,
+        geometry: ParametricGeometry,
+        power_preference: str = "high-performance",
+        limits=None,
+    ):
         """
-        Setup asynchronous drawing for a parametric geometry
+        Setup synchronous drawing for a geometry whose parameters never change
+
+        Pipeline, bind group and vertex count are resolved at setup and bound
+        as closure locals, so the frame records one draw without looping over
+        draw items or reading the geometry. Parameter updates made after setup
+        are not picked up - use create_dynamic_renderer() for geometries that change.
 
         Args:
             canvas: Canvas implementing WgpuCanvasInterface
             geometry: ParametricGeometry instance with parameters
+            power_preference: GPU power preference
             limits: GPU limits
 
         Returns:
-            Async draw function ready for canvas.request_draw()
+            Draw function ready for canvas.request_draw()
         """
-        if not isinstance(geometry, ParametricGeometry):
-            raise TypeError("geometry must be a ParametricGeometry instance")
+        Renderer._check_geometry(geometry)
 
-        # Initialize WebGPU adapter and device asynchronously
-        adapter = await wgpu.gpu.request_adapter_async(power_preference="high-performance")
-        device = await adapter.request_device_async(required_limits=limits)
+        device = Renderer._get_device(power_preference, limits)
+        draw_items = Renderer._create_draw_items(canvas, device, [geometry])
+
+        return Renderer._get_draw_function(canvas, device, draw_items, static=True)
+
+    @staticmethod
+    def setup_scene_drawing_sync(
+        canvas,
+        geometries: list[ParametricGeometry],
+        power_preference: str = "high-performance",
+        limits=None,
+    ):
+        """
+        Setup synchronous drawing for several parametric geometries on one device
+
+        All geometries are recorded into a single render pass: one clear, one
+        pipeline switch per geometry, one command buffer and one queue submit.
+
+        Args:
+            canvas: Canvas implementing WgpuCanvasInterface
+            geometries: ParametricGeometry instances, drawn in order
+            power_preference: GPU power preference
+            limits: GPU limits
+
+        Returns:
+            Draw function ready for canvas.request_draw()
+        """
+        if not geometries:
+            raise ValueError("geometries must contain at least one ParametricGeometry")
+        for geometry in geometries:
+            Renderer._check_geometry(geometry)
 
-        # Create and populate uniform buffer for geometry parameters
+        # One device shared by every geometry, so they can share a pass
+        device = Renderer._get_device(power_preference, limits)
+
+        # Setup uniforms and render pipelines - following three's Material pattern
+        draw_items = Renderer._create_draw_items(canvas, device, geometries)
+
+        return Renderer._get_draw_function(canvas, device, draw_items)
+
+    @staticmethod
+    def to_async(draw_function):
+        """
+        Wrap a draw function for callers that need an awaitable
+
+        Draw functions are synchronous - canvases call them directly - so this
+        is only an opt-in adapter and adds nothing to the frame itself.
+
+        Args:
+            draw_function: Draw function returned by one of the setup methods
+
+        Returns:
+            Coroutine function performing the same draw
+        """
+
+        async def draw_frame_async():
+            draw_function()
+
+        return draw_frame_async
+
+    @staticmethod
+    def _check_geometry(geometry, interface=_GEOMETRY_INTERFACE):
+        """Check that geometry provides the ParametricGeometry interface (duck-typed)"""
+        for attribute in interface:
+            if not hasattr(geometry, attribute):
+                raise TypeError(
+                    f"geometry must implement the ParametricGeometry interface, "
+                    f"missing '{attribute}'"
+                )
+
+    @staticmethod
+    def _device_key(power_preference, limits):
+        """Hashable device cache key - limits may be given as a dict"""
+        return power_preference, tuple(sorted(limits.items())) if limits else None
+
+    @staticmethod
+    def _get_device(power_preference, limits):
+        """Return the cached device for these settings, requesting it on first use"""
+        key = Renderer._device_key(power_preference, limits)
+        device = _DEVICE_CACHE.get(key)
+        if device is None:
+            # Issued as promises so wgpu's poll thread drives the requests while we wait
+            adapter = wgpu.gpu.request_adapter_async(power_preference=power_preference).sync_wait()
+            device = adapter.request_device_async(required_limits=limits).sync_wait()
+            _DEVICE_CACHE[key] = device
+        return device
+
+    @staticmethod
+    async def _get_device_async(power_preference, limits):
+        """Asynchronous _get_device() - concurrent setups wait for a single request"""
+        key = Renderer._device_key(power_preference, limits)
+        async with _DEVICE_LOCK:
+            device = _DEVICE_CACHE.get(key)
+            if device is None:
+                adapter = await wgpu.gpu.request_adapter_async(power_preference=power_preference)
+                device = await adapter.request_device_async(required_limits=limits)
+                _DEVICE_CACHE[key] = device
+        return device
+
+    @staticmethod
+    def _create_draw_items(canvas, device, geometries):
+        """
+        Create uniforms and render pipelines for geometries on a shared device
+
+        All pipeline builds are issued through create_render_pipeline_async()
+        before any of them is waited on, so backends that compile shaders in
+        the background can overlap the work instead of blocking per pipeline.
+
+        Returns:
+            List of (render_pipeline, bind_group, geometry, dynamic_offsets) tuples
+        """
+        pending = []
+        for geometry in geometries:
+            bind_group_layout, bind_group = Renderer._create_uniform_bind_group(device, geometry)
+            promise = Renderer._create_render_pipeline(canvas, device, geometry, bind_group_layout)
+            pending.append((promise, bind_group, geometry))
+
+        return [
+            (promise.sync_wait(), bind_group, geometry, ())
+            for promise, bind_group, geometry in pending
+        ]
+
+    @staticmethod
+    def _create_uniform_bind_group(device, geometry):
+        """
+        Create and populate the uniform buffer for a geometry and bind it
+
+        Returns:
+            Tuple of (bind_group_layout, bind_group)
+        """
+        uniform_size = Renderer._aligned_uniform_size(geometry)
         uniform_data = geometry.get_uniform_data()
-        uniform_buffer = device.create_buffer(
-            size=geometry.get_uniform_size(),
-            usage=wgpu.BufferUsage.UNIFORM | wgpu.BufferUsage.COPY_DST,
-        )
-        device.queue.write_buffer(uniform_buffer, 0, uniform_data)
+        if len(uniform_data) < uniform_size:
+            uniform_data = bytes(uniform_data).ljust(uniform_size, b"\0")
 
-        # Create bind group layout for uniforms
-        bind_group_layout = device.create_bind_group_layout(
-            entries=[
-                {
-                    "binding": 0,
-                    "visibility": wgpu.ShaderStage.VERTEX | wgpu.ShaderStage.FRAGMENT,
-                    "buffer": {
-                        "type": wgpu.BufferBindingType.uniform,
-                        "has_dynamic_offset": False,
-                        "min_binding_size": geometry.get_uniform_size(),
-                    },
-                }
-            ]
-        )
+        # Create uniform buffer mapped at creation and fill it directly - this skips
+        # the extra staging copy queue.write_buffer() makes for the initial upload
+        uniform_buffer = device.create_buffer_with_data(data=uniform_data, usage=_UNIFORM_USAGE)
+
+        return Renderer._bind_uniform_buffer(device, uniform_buffer, uniform_size)
+
+    @staticmethod
+    def _aligned_uniform_size(geometry):
+        """Uniform size of a geometry rounded up to the 16-byte WGSL struct alignment"""
+        return (geometry.get_uniform_size() + 15) & ~15
+
+    @staticmethod
+    def _bind_uniform_buffer(device, uniform_buffer, uniform_size, *, has_dynamic_offset=False):
+        """
+        Create bind group layout and bind group exposing a uniform buffer at binding 0
+
+        Args:
+            device: GPUDevice owning the buffer
+            uniform_buffer: Buffer holding the geometry parameters
+            uniform_size: Size of one set of parameters in bytes
+            has_dynamic_offset: Whether the binding is selected with a dynamic offset
+
+        Returns:
+            Tuple of (bind_group_layout, bind_group)
+        """
+        # Create bind group layout for uniforms - shared by all bindings of the same shape
+        key = (device, uniform_size, has_dynamic_offset)
+        bind_group_layout = _BIND_GROUP_LAYOUT_CACHE.get(key)
+        if bind_group_layout is None:
+            bind_group_layout = device.create_bind_group_layout(
+                entries=[
+                    {
+                        "binding": 0,
+                        "visibility": _UNIFORM_VISIBILITY,
+                        "buffer": {
+                            "type": wgpu.BufferBindingType.uniform,
+                            "has_dynamic_offset": has_dynamic_offset,
+                            "min_binding_size": uniform_size,
+                        },
+                    }
+                ]
+            )
+            _BIND_GROUP_LAYOUT_CACHE[key] = bind_group_layout
 
         # Create bind group with uniform buffer
         bind_group = device.create_bind_group(
@@ -144,35 +321,68 @@ class Renderer:
                     "resource": {
                         "buffer": uniform_buffer,
                         "offset": 0,
-                        "size": geometry.get_uniform_size(),
+                        "size": uniform_size,
                     },
                 }
             ],
         )
 
-        # Setup render pipeline asynchronously
-        pipeline_kwargs = Renderer._get_render_pipeline_kwargs(
-            canvas, device, geometry, bind_group_layout
-        )
-        render_pipeline = await device.create_render_pipeline_async(**pipeline_kwargs)
+        return bind_group_layout, bind_group
 
-        return Renderer._get_draw_function(
-            canvas, device, render_pipeline, geometry, bind_group, asynchronous=True
-        )
+    @staticmethod
+    def _create_render_pipeline(canvas, device, geometry, bind_group_layout):
+        """
+        Start building the render pipeline for a geometry
+
+        Returns:
+            Promise resolving to the GPURenderPipeline - await it or call sync_wait()
+        """
+        render_texture_format = Renderer._configure_context(canvas, device)
+
+        # The promise itself is cached - awaiting or sync_wait() on it again is free
+        key = (device, geometry.shader_source, render_texture_format, bind_group_layout)
+        promise = _PIPELINE_CACHE.get(key)
+        if promise is None:
+            pipeline_kwargs = Renderer._get_render_pipeline_kwargs(
+                canvas, device, geometry, bind_group_layout
+            )
+            promise = device.create_render_pipeline_async(**pipeline_kwargs)
+            _PIPELINE_CACHE[key] = promise
+        return promise
 
     @staticmethod
-    def _get_render_pipeline_kwargs(canvas, device, geometry, bind_group_layout):
+    def _configure_context(canvas, device):
         """
-        Create render pipeline configuration for a parametric geometry
-        Enhanced from original to support bind group layouts
+        Configure the canvas context for a device
+
+        Returns:
+            Render texture format the context was configured with
         """
-        # Configure canvas context
+        # Configure canvas context once per device - reconfiguring may recreate the swapchain
+        configured = getattr(canvas, "_wgpu_configured", None)
+        if configured is not None and configured[0] is device:
+            return configured[1]
+
         context = canvas.get_context("wgpu")
         render_texture_format = context.get_preferred_format(device.adapter)
         context.configure(device=device, format=render_texture_format)
+        canvas._wgpu_configured = (device, render_texture_format)
+        return render_texture_format
+
+    @staticmethod
+    def _get_render_pipeline_kwargs(canvas, device, geometry, bind_group_layout):
+        """
+        Create render pipeline configuration for a parametric geometry
+        Enhanced from original to support bind group layouts
+        """
+        render_texture_format = Renderer._configure_context(canvas, device)
 
         # Create shader module from geometry's parametric shader
-        shader = device.create_shader_module(code=geometry.shader_source)
+        key = (device, geometry.shader_source)
+        shader = _SHADER_CACHE.get(key)
+        if shader is None:
+            shader = device.create_shader_module(code=geometry.shader_source)
+            _SHADER_CACHE[key] = shader
 
         # Create pipeline layout with bind group layout
         pipeline_layout = device.create_pipeline_layout(bind_group_layouts=[bind_group_layout])
@@ -206,43 +416,112 @@ class Renderer:
         }
 
     @staticmethod
-    def _get_draw_function(canvas, device, render_pipeline, geometry, bind_group, *, asynchronous):
+    def _get_encode_function(context, draw_items, static=False):
+        """
+        Create a function recording one render pass for all draw items
+
+        Args:
+            context: Configured wgpu canvas context to render into
+            draw_items: List of (render_pipeline, bind_group, geometry, dynamic_offsets) tuples
+            static: Specialise for a single item without dynamic uniforms, with
+                its vertex count resolved now instead of every frame
+
+        Returns:
+            Function taking a GPUCommandEncoder
+        """
+        # Built once and reused - each frame only swaps in the new texture view
+        color_attachment = dict(_COLOR_ATTACHMENT_TEMPLATE)
+        color_attachments = [color_attachment]
+        texture = None
+
+        def begin_render_pass(command_encoder):
+            nonlocal texture
+
+            # Acquire the texture last - it is the call that may block on presentation
+            current_texture = context.get_current_texture()
+            if current_texture is not texture:
+                # Contexts hand back the same texture until it rotates or resizes,
+                # so its view is only created when the texture actually changes
+                texture = current_texture
+                color_attachment["view"] = current_texture.create_view()
+            return command_encoder.begin_render_pass(color_attachments=color_attachments)
+
+        if static:
+            if len(draw_items) != 1:
+                raise ValueError(
+                    f"static drawing takes exactly one geometry, got {len(draw_items)}"
+                )
+            render_pipeline, bind_group, geometry, dynamic_offsets = draw_items[0]
+            if dynamic_offsets:
+                raise ValueError("static drawing does not support dynamic uniform offsets")
+            vertex_count = int(geometry.vertex_count)
+
+            def encode_static_frame(command_encoder):
+                render_pass = begin_render_pass(command_encoder)
+                render_pass.set_pipeline(render_pipeline)
+                render_pass.set_bind_group(0, bind_group)
+                render_pass.draw(vertex_count, 1, 0, 0)
+                render_pass.end()
+
+            return encode_static_frame
+
+        def encode_frame(command_encoder):
+            render_pass = begin_render_pass(command_encoder)
+
+            for render_pipeline, bind_group, geometry, dynamic_offsets in draw_items:
+                # Set pipeline and bind uniform parameters - bind groups are only ever
+                # created at setup; creating them per frame exhausts descriptor pools
+                render_pass.set_pipeline(render_pipeline)
+                render_pass.set_bind_group(0, bind_group, dynamic_offsets)
+
+                # Draw using procedural vertex generation
+                render_pass.draw(geometry.vertex_count, 1, 0, 0)
+
+            render_pass.end()
+
+        return encode_frame
+
+    @staticmethod
+    def _get_draw_function(canvas, device, draw_items, static=False):
         """
-        Create draw function for a parametric geometry
+        Create draw function for one or more parametric geometries
         Enhanced from original to use bind groups for uniform parameters
         """
+        # Resolve the canvas context once - it is the same object every frame
+        context = canvas.get_context("wgpu")
+        encode_frame = Renderer._get_encode_function(context, draw_items, static)
 
-        def draw_frame_sync():
-            current_texture_view = canvas.get_context("wgpu").get_current_texture().create_view()
-            command_encoder = device.create_command_encoder()
-            render_pass = command_encoder.begin_render_pass(
-                color_attachments=[
-                    {
-                        "view": current_texture_view,
-                        "resolve_target": None,
-                        "clear_value": (0, 0, 0, 1),
-                        "load_op": wgpu.LoadOp.clear,
-                        "store_op": wgpu.StoreOp.store,
-                    }
-                ]
-            )
+        # Pre-bind per-frame constants so the frame function only makes WebGPU calls
+        queue = device.queue
+        create_command_encoder = device.create_command_encoder
 
-            # Set pipeline and bind uniform parameters
-            render_pass.set_pipeline(render_pipeline)
-            render_pass.set_bind_group(0, bind_group)
+        # finish() consumes an encoder, so the next frame's encoder is created
+        # right after each submit while the GPU works, not at the start of a frame
+        command_encoder = create_command_encoder()
 
-            # Draw using procedural vertex generation
-            render_pass.draw(geometry.vertex_count, 1, 0, 0)
-            render_pass.end()
-            device.queue.submit([command_encoder.finish()])
+        def draw_frame_sync():
+            nonlocal command_encoder
+            try:
+                encode_frame(command_encoder)
+                queue.submit([command_encoder.finish()])
+            finally:
+                # Also replaces an encoder left locked by a pass that raised mid-frame
+                command_encoder = create_command_encoder()
 
-        async def draw_frame_async():
-            draw_frame_sync()  # WebGPU draw calls are not inherently async
+        return draw_frame_sync
+
+    @staticmethod
+    def clear_caches():
+        """
+        Drop all cached devices, shader modules, layouts and pipelines
 
-        if asynchronous:
-            return draw_frame_async
-        else:
-            return draw_frame_sync
+        Renderers that are already set up keep working; only later setups
+        request and compile everything again.
+        """
+        _DEVICE_CACHE.clear()
+        _SHADER_CACHE.clear()
+        _BIND_GROUP_LAYOUT_CACHE.clear()
+        _PIPELINE_CACHE.clear()
 
     @staticmethod
     def print_available_adapters():
@@ -255,20 +534,80 @@ class Renderer:
             print(adapter.summary)
 
     @staticmethod
-    def create_dynamic_renderer(canvas, initial_geometry: ParametricGeometry):
+    def create_dynamic_renderer(
+        canvas,
+        initial_geometry: ParametricGeometry,
+        power_preference: str = "high-performance",
+        limits=None,
+        ring_size: int = 3,
+    ):
         """
         Create a renderer that can update geometry parameters dynamically
 
+        The pipeline and bind group are built once. Each update writes the new
+        parameters into the next slot of a ring-buffered uniform buffer, which
+        the draw selects with a dynamic offset - so a slot the GPU may still be
+        reading is never overwritten and nothing is rebuilt per update.
+        After writing uniform_view fields in place, call mark_uniforms_dirty()
+        and then update_geometry() with no arguments to upload them.
+
         Args:
             canvas: Canvas implementing WgpuCanvasInterface
             initial_geometry: Initial ParametricGeometry instance
+            power_preference: GPU power preference
+            limits: GPU limits
+            ring_size: Number of uniform slots cycled through by updates
 
         Returns:
             Dictionary with 'draw' function and 'update_geometry' function
         """
-        # This would be for advanced use cases where parameters change frequently
-        # For now, users should create new geometries and renderers for parameter changes
-        raise NotImplementedError(
-            "Dynamic parameter updates not yet implemented. "
-            "Create new geometry instances for parameter changes."
+        Renderer._check_geometry(initial_geometry, _DYNAMIC_GEOMETRY_INTERFACE)
+        if ring_size < 1:
+            raise ValueError(f"ring_size must be at least 1, got {ring_size}")
+
+        geometry = initial_geometry
+        device = Renderer._get_device(power_preference, limits)
+        queue = device.queue
+
+        # Slots are spaced by the device's dynamic offset alignment
+        uniform_size = Renderer._aligned_uniform_size(geometry)
+        alignment = device.limits["min-uniform-buffer-offset-alignment"]
+        slot_size = (uniform_size + alignment - 1) // alignment * alignment
+        uniform_buffer = device.create_buffer(
+            size=slot_size * ring_size,
+            usage=_UNIFORM_USAGE,
+        )
+        queue.write_buffer(uniform_buffer, 0, geometry.get_uniform_data())
+
+        bind_group_layout, bind_group = Renderer._bind_uniform_buffer(
+            device, uniform_buffer, uniform_size, has_dynamic_offset=True
         )
+        render_pipeline = Renderer._create_render_pipeline(
+            canvas, device, geometry, bind_group_layout
+        ).sync_wait()
+
+        # Shared with the draw item and updated in place to select the current slot
+        dynamic_offsets = [0]
+        slot = 0
+        uploaded_version = geometry.uniform_version
+
+        def update_geometry(**parameters):
+            nonlocal slot, uploaded_version
+            for name, value in parameters.items():
+                geometry.update_parameter(name, value)
+
+            # Unchanged uniforms leave the version alone - nothing to upload
+            if geometry.uniform_version == uploaded_version:
+                return
+            uploaded_version = geometry.uniform_version
+
+            # Only buffer contents change - the bind group created at setup stays valid
+            slot = (slot + 1) % ring_size
+            queue.write_buffer(uniform_buffer, slot * slot_size, geometry.get_uniform_data())
+            dynamic_offsets[0] = slot * slot_size
+
+        draw_frame_sync = Renderer._get_draw_function(
+            canvas, device, [(render_pipeline, bind_group, geometry, dynamic_offsets)]
+        )
+
+        return {"draw": draw_frame_sync, "update_geometry": update_geometry}
@@ -4,12 +4,38 @@ Prepares architecture for future transform methods
 """
 
 import imageio.v3 as iio
-import numpy as np
 from rendercanvas.offscreen import RenderCanvas
 
 from .renderer import Renderer
 
 
+# Speed presets used when Scene.draw() is not given one - other codecs keep their own
+_DEFAULT_PRESETS = {"libx264": "veryfast"}
+
+# Codec-private options that stop scene cuts from inserting extra keyframes
+_SCENECUT_PARAMS = {"libx264": ["-sc_threshold", "0"]}
+
+# Offscreen canvases shared by every scene drawn in this process, keyed by size
+_CANVAS_CACHE: dict[tuple[int, int], RenderCanvas] = {}
+
+
+def _get_canvas(size):
+    """
+    Get the shared offscreen canvas for a frame size, creating it on first use
+
+    Args:
+        size: (width, height) of the canvas
+
+    Returns:
+        RenderCanvas pinned to rgba-u8
+    """
+    canvas = _CANVAS_CACHE.get(size)
+    if canvas is None:
+        canvas = RenderCanvas(size=size, format="rgba-u8")
+        _CANVAS_CACHE[size] = canvas
+    return canvas
+
+
 class Scene:
     """
     Scene manages geometries and automatically creates videos
@@ -26,34 +52,75 @@ class Scene:
         else:
             self.geometries.append(geometry_or_list)
 
-    def draw(self, filename="output.mp4"):
+    def draw(
+        self,
+        filename="output.mp4",
+        fps=30,
+        n_frames=150,
+        codec="libx264",
+        preset=None,
+        threads=None,
+        verbose=True,
+    ):
         """
         Automatically create video - hides all complexity
         User doesn't need to understand for loops or video creation
+
+        Args:
+            filename: Output video path
+            fps: Frames per second of the video
+            n_frames: Number of frames in the video
+            codec: ffmpeg video encoder, e.g. "libx264" or "libsvtav1" where available
+            preset: Encoder speed preset, e.g. "veryfast" for x264 or "13" for SVT-AV1;
+                None uses the codec's default from _DEFAULT_PRESETS, if any
+            threads: Encoder thread count, None lets ffmpeg decide
+            verbose: Print progress messages; disable when benchmarking or batching
         """
         if not self.geometries:
-            print("No geometries in scene")
+            if verbose:
+                print("No geometries in scene")
             return
 
-        # For now, render first geometry (multi-geometry coming later)
-        geometry = self.geometries[0]
-
-        # Internal video creation - user doesn't see this complexity
-        canvas = RenderCanvas(size=(640, 480))
-        draw_frame = Renderer.setup_drawing_sync(canvas, geometry)
-
-        print("Creating video...")
-
-        # Hidden complexity - user doesn't need to understand
-        video_frames = []
-        for i in range(150):
-            canvas.request_draw(draw_frame)
-            frame = np.asarray(canvas.draw())[:, :, :3]
+        # Internal video creation - all geometries share one device and render pass
+        # Pinned to rgba-u8 so every frame reads back as uint8 and needs no conversion;
+        # the canvas is reused across scenes so only the draw function changes per video
+        canvas = _get_canvas((640, 480))
+        if len(self.geometries) == 1:
+            # Parameters are fixed while drawing, so a lone geometry gets the draw
+            # function with everything resolved at setup
+            draw_frame = Renderer.setup_drawing_static(canvas, self.geometries[0])
+        else:
+            draw_frame = Renderer.setup_scene_drawing_sync(canvas, self.geometries)
 
-            if frame.dtype != np.uint8:
-                frame = (np.clip(frame, 0, 1) * 255).astype(np.uint8)
+        if verbose:
+            print("Creating video...")
 
-            video_frames.append(frame)
+        # Hidden complexity - geometries don't animate yet, so every frame is identical:
+        # render it once and hand the encoder n references to it instead of re-rendering
+        canvas.request_draw(draw_frame)
+        # The offscreen canvas already returns a contiguous uint8 ndarray, and the RGBA goes
+        # to ffmpeg as is - swscale drops alpha while converting to yuv420p
+        frame = canvas.draw()
 
-        iio.imwrite(filename, video_frames, fps=30)
-        print(f"Video saved: {filename}")
+        # Fixed one-second GOP without B-frames, so every second is a keyframe to seek to
+        gop_params = ["-g", str(fps), "-keyint_min", str(fps), "-bf", "0"]
+        encoder_params = [*gop_params, *_SCENECUT_PARAMS.get(codec, ())]
+        # -preset values are encoder-specific, so it is only passed for a known codec
+        # or when asked for explicitly
+        if preset is None:
+            preset = _DEFAULT_PRESETS.get(codec)
+        if preset is not None:
+            encoder_params += ["-preset", str(preset)]
+        if threads is not None:
+            encoder_params += ["-threads", str(threads)]
+        iio.imwrite(
+            filename,
+            [frame] * n_frames,
+            plugin="FFMPEG",
+            is_batch=True,
+            fps=fps,
+            codec=codec,
+            output_params=encoder_params,
+        )
+        if verbose:
+            print(f"Video saved: {filename}")
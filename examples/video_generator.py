@@ -3,9 +3,19 @@ Radically simple video generator - user doesn't need programming knowledge
 No for loops, no complexity - just create shapes and call scene.draw()
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from animanode import Circle, Rectangle, Scene, Triangle
 
 
+def draw_scene(geometry, filename, threads):
+    """Draw one geometry into its own video file"""
+    scene = Scene()
+    scene.add(geometry)
+    scene.draw(filename, threads=threads)
+
+
 def main():
     """User-friendly approach - no programming complexity visible"""
 
@@ -15,17 +25,17 @@ def main():
     triangle = Triangle(size=0.9, rotation=0.0)
 
     # Simple scene approach - user doesn't see video creation complexity
-    scene1 = Scene()
-    scene1.add(circle)
-    scene1.draw("circle.mp4")
-
-    scene2 = Scene()
-    scene2.add(rect)
-    scene2.draw("rectangle.mp4")
-
-    scene3 = Scene()
-    scene3.add(triangle)
-    scene3.draw("triangle.mp4")
+    # Each video is independent, so they are rendered and encoded in parallel processes
+    videos = [(circle, "circle.mp4"), (rect, "rectangle.mp4"), (triangle, "triangle.mp4")]
+    # Split the cores between the encoders so the parallel videos don't oversubscribe them
+    threads = max(1, (os.cpu_count() or 1) // len(videos))
+    with ProcessPoolExecutor(max_workers=len(videos)) as executor:
+        futures = [
+            executor.submit(draw_scene, geometry, filename, threads)
+            for geometry, filename in videos
+        ]
+        for future in futures:
+            future.result()
 
 
 def future_vision_example():
@@ -0,0 +1,46 @@
+"""
+Regression tests for the draw functions returned by Renderer setups
+"""
+
+import numpy as np
+import pytest
+import wgpu
+from rendercanvas.offscreen import RenderCanvas
+
+from animanode import Rectangle, Renderer
+
+
+def _has_adapter():
+    try:
+        return bool(wgpu.gpu.enumerate_adapters_sync())
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _has_adapter(), reason="no wgpu adapter available")
+
+
+def _lit_pixels(canvas, draw_frame):
+    """Render one frame and count pixels a geometry covered"""
+    canvas.request_draw(draw_frame)
+    frame = np.asarray(canvas.draw())
+    return int(np.count_nonzero(frame[:, :, :3].any(axis=2)))
+
+
+def test_draw_recovers_after_failed_frame():
+    canvas = RenderCanvas(size=(64, 48), format="rgba-u8")
+    rectangle = Rectangle(width=0.5, height=0.5)
+    draw_frame = Renderer.setup_scene_drawing_sync(canvas, [rectangle])
+    lit = _lit_pixels(canvas, draw_frame)
+
+    # Fails inside the open render pass
+    vertex_count = rectangle.vertex_count
+    rectangle.vertex_count = "six"
+    with pytest.raises(TypeError):
+        draw_frame()
+
+    # The next frame must not reuse the encoder the failed pass left locked; called
+    # directly because canvas.draw() logs draw errors instead of raising them
+    rectangle.vertex_count = vertex_count
+    draw_frame()
+    assert _lit_pixels(canvas, draw_frame) == lit
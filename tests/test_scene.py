@@ -0,0 +1,107 @@
+"""
+Tests for Scene.draw video output and the multi-geometry single-pass path
+"""
+
+import imageio.v3 as iio
+import numpy as np
+import pytest
+import wgpu
+from rendercanvas.offscreen import RenderCanvas
+
+from animanode import Rectangle, Renderer, Scene, Triangle
+from animanode import scene as scene_module
+
+
+def _has_adapter():
+    try:
+        return bool(wgpu.gpu.enumerate_adapters_sync())
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _has_adapter(), reason="no wgpu adapter available")
+
+
+@pytest.fixture
+def output_params(monkeypatch):
+    """Record the ffmpeg output_params of every imwrite call while still writing"""
+    calls = []
+    imwrite = scene_module.iio.imwrite
+
+    def recording_imwrite(*args, **kwargs):
+        calls.append(kwargs["output_params"])
+        return imwrite(*args, **kwargs)
+
+    monkeypatch.setattr(scene_module.iio, "imwrite", recording_imwrite)
+    return calls
+
+
+def _frame_count(filename):
+    return sum(1 for _ in iio.imiter(filename, plugin="FFMPEG"))
+
+
+def test_draw_with_non_default_codec(tmp_path, output_params):
+    scene = Scene()
+    scene.add(Rectangle(width=0.8, height=0.6))
+    filename = str(tmp_path / "rectangle.avi")
+
+    scene.draw(filename, fps=10, n_frames=5, codec="mpeg4", verbose=False)
+
+    assert _frame_count(filename) == 5
+    # x264-only options must not reach other encoders
+    assert "-preset" not in output_params[0]
+    assert "-sc_threshold" not in output_params[0]
+
+
+def test_draw_preset_and_threads(tmp_path, output_params):
+    scene = Scene()
+    scene.add(Rectangle(width=0.8, height=0.6))
+    filename = str(tmp_path / "rectangle.mp4")
+
+    scene.draw(filename, n_frames=3, verbose=False)
+    scene.draw(filename, n_frames=3, preset="ultrafast", threads=2, verbose=False)
+
+    default_params, explicit_params = output_params
+    assert default_params[default_params.index("-preset") + 1] == "veryfast"
+    assert explicit_params[explicit_params.index("-preset") + 1] == "ultrafast"
+    assert explicit_params[explicit_params.index("-threads") + 1] == "2"
+    assert "-threads" not in default_params
+    assert _frame_count(filename) == 3
+
+
+def test_draw_quiet_and_verbose(tmp_path, capsys):
+    scene = Scene()
+    scene.add(Rectangle(width=0.8, height=0.6))
+    filename = str(tmp_path / "rectangle.mp4")
+
+    scene.draw(filename, n_frames=2, verbose=False)
+    assert capsys.readouterr().out == ""
+
+    scene.draw(filename, n_frames=2)
+    assert f"Video saved: {filename}" in capsys.readouterr().out
+
+
+def test_multi_geometry_scene(tmp_path):
+    scene = Scene()
+    scene.add([Rectangle(width=0.8, height=0.6), Triangle(size=0.9)])
+    filename = str(tmp_path / "scene.mp4")
+
+    scene.draw(filename, n_frames=4, verbose=False)
+
+    assert _frame_count(filename) == 4
+
+
+def test_scene_drawing_records_every_geometry():
+    def lit_pixels(geometries):
+        canvas = RenderCanvas(size=(64, 48), format="rgba-u8")
+        canvas.request_draw(Renderer.setup_scene_drawing_sync(canvas, geometries))
+        frame = np.asarray(canvas.draw())
+        return int(np.count_nonzero(frame[:, :, :3].any(axis=2)))
+
+    rectangle = Rectangle(width=0.4, height=0.4)
+    triangle = Triangle(size=0.9, rotation=3.0)
+
+    # Both geometries land in the one render pass - neither clears the other
+    both = lit_pixels([rectangle, triangle])
+    assert both > lit_pixels([rectangle])
+    assert both > lit_pixels([triangle])